@@ -3,17 +3,16 @@ import logging
 import time
 import random
 import schedule
-import requests
 from datetime import datetime
 from pytrends.request import TrendReq
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from config import (
-    OPENROUTER_API_KEY,
     BLOGGER_ID,
     load_blogger_token
 )
+from src.services.content_generator import ContentGenerator
 
 # Configure logging with UTF-8 encoding
 logging.basicConfig(
@@ -25,9 +24,6 @@ logging.basicConfig(
     ]
 )
 
-# OpenRouter configuration
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
-
 class BloggerBot:
     # Available Blogger labels
     AVAILABLE_LABELS = [
@@ -109,80 +105,17 @@ class BloggerBot:
             
             # If trending topics fetch failed, we'll use default topics (handled in except block)
 
-    def generate_blog_post(self, topic, max_retries=3):
-        system_message = (
-            "You are a professional blog writer. Write engaging, well-researched, "
-            "and informative content. Use a conversational yet professional tone. "
-            "Format the content with proper HTML tags for better presentation."
-        )
-        
-        prompt = (
-            f"Write an engaging and informative blog post about: {topic}\n\n"
-            f"Requirements:\n"
-            f"1. Around 500 words\n"
-            f"2. Include a brief introduction that hooks the reader\n"
-            f"3. Provide relevant details, examples, and analysis\n"
-            f"4. End with a strong conclusion\n"
-            f"5. Use proper HTML formatting (<h2> for headings, <p> for paragraphs)\n"
-            f"6. Include SEO-friendly headings\n"
-            f"7. Write in a clear, engaging style"
-        )
-
-        headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/blog-bot",
-            "OR-ORGANIZATION": "github.com/blog-bot"
-        }
-
-        data = {
-            "model": "openai/gpt-3.5-turbo",
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 2048,
-            "top_p": 0.9
-        }
+    def generate_blog_post(self, topic, max_retries=3, label=None):
+        # Prompts and request bodies are precompiled in src.services.prompt_templates
+        return ContentGenerator.generate_blog_post(topic, max_retries=max_retries, label=label)
 
-        for attempt in range(max_retries):
-            try:
-                # Use requests library directly instead of OpenAI client
-                response = requests.post(
-                    OPENROUTER_API_URL,
-                    headers=headers,
-                    json=data
-                )
-                
-                # Print the raw response for debugging
-                logging.info(f"API Response Status: {response.status_code}")
-                
-                # If there's an error, log the full response
-                if response.status_code != 200:
-                    logging.error(f"API Error Response: {response.text}")
-                    response.raise_for_status()
-                
-                # Parse the response
-                result = response.json()
-                content = result["choices"][0]["message"]["content"]
-                
-                # Log successful generation
-                logging.info(f"Successfully generated content of length: {len(content)}")
-                
-                return content
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-                logging.warning(f"Error generating blog post (attempt {attempt + 1}): {str(e)}")
-                time.sleep(5)
-
-    def post_to_blogger(self, title, content, max_retries=3):
+    def post_to_blogger(self, title, content, max_retries=3, label=None):
         if not self.token_data:
             raise ValueError("Blogger token not found. Please run get_token.py first.")
 
-        # Classify the topic into an appropriate label
-        label = self.classify_topic(title)
+        # Classify the topic into an appropriate label unless the caller already did
+        if label is None:
+            label = self.classify_topic(title)
         logging.info(f"📑 Classified topic under label: {label}")
 
         for attempt in range(max_retries):
@@ -226,11 +159,13 @@ class BloggerBot:
             topic = self.get_trending_topic()
             logging.info(f"🧠 Trending topic: {topic}")
             
-            content = self.generate_blog_post(topic)
+            # Classify once so the prompt variant and the posted label match
+            label = self.classify_topic(topic)
+            
+            content = self.generate_blog_post(topic, label=label)
             logging.info(f"📝 Generated content length: {len(content)} characters")
             
-            # Post to Blogger (label classification is done inside post_to_blogger)
-            success = self.post_to_blogger(topic, content)
+            success = self.post_to_blogger(topic, content, label=label)
             if not success:
                 return False
                 
@@ -16,13 +16,16 @@ def job():
         topic = TrendingTopics.get_trending_topic()
         logger.info(f"🧠 Trending topic: {topic}")
         
+        # Pick the prompt variant for the topic's label
+        blogger_service = BloggerService(BLOGGER_ID)
+        label = blogger_service.classify_topic(topic)
+        
         # Generate content
-        content = ContentGenerator.generate_blog_post(topic)
+        content = ContentGenerator.generate_blog_post(topic, label=label)
         logger.info(f"📝 Generated content length: {len(content)} characters")
         
         # Post to Blogger
-        blogger_service = BloggerService(BLOGGER_ID)
-        success = blogger_service.post_to_blogger(topic, content)
+        success = blogger_service.post_to_blogger(topic, content, label=label)
         
         if not success:
             return False
@@ -54,13 +54,14 @@ class BloggerService:
             
         return best_label
 
-    def post_to_blogger(self, title, content, max_retries=3):
-        """Post content to Blogger with automatic label classification."""
+    def post_to_blogger(self, title, content, max_retries=3, label=None):
+        """Post content to Blogger, classifying the title if no label is given."""
         if not self.token_data:
             raise ValueError("Blogger token not found. Please run get_token.py first.")
 
-        # Classify the topic into an appropriate label
-        label = self.classify_topic(title)
+        # Classify the topic into an appropriate label unless the caller already did
+        if label is None:
+            label = self.classify_topic(title)
         logger.info(f"📑 Classified topic under label: {label}")
 
         for attempt in range(max_retries):
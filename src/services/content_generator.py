@@ -2,7 +2,7 @@
 import time
 import requests
 from ..utils.logger import setup_logging
-from ..utils.config import OPENROUTER_API_KEY
+from .prompt_templates import HEADERS, get_template
 
 logger = setup_logging()
 
@@ -10,50 +10,31 @@ class ContentGenerator:
     OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
     @staticmethod
-    def generate_blog_post(topic, max_retries=3):
-        """Generate a blog post using OpenRouter AI."""
-        system_message = (
-            "You are a professional blog writer. Write engaging, well-researched, "
-            "and informative content. Use a conversational yet professional tone. "
-            "Format the content with proper HTML tags for better presentation."
-        )
-        
-        prompt = (
-            f"Write an engaging and informative blog post about: {topic}\n\n"
-            f"Requirements:\n"
-            f"1. Around 500 words\n"
-            f"2. Include a brief introduction that hooks the reader\n"
-            f"3. Provide relevant details, examples, and analysis\n"
-            f"4. End with a strong conclusion\n"
-            f"5. Use proper HTML formatting (<h2> for headings, <p> for paragraphs)\n"
-            f"6. Include SEO-friendly headings\n"
-            f"7. Write in a clear, engaging style"
+    def log_usage(usage):
+        """Log token usage, including prompt tokens served from the provider cache."""
+        if not usage:
+            return
+        details = usage.get("prompt_tokens_details") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        cached_tokens = details.get("cached_tokens", 0)
+        logger.info(
+            f"Token usage: prompt={prompt_tokens} (cached={cached_tokens}), "
+            f"completion={usage.get('completion_tokens', 0)}"
         )
 
-        headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/blog-bot",
-            "OR-ORGANIZATION": "github.com/blog-bot"
-        }
-
-        data = {
-            "model": "openai/gpt-3.5-turbo",
-            "messages": [
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 2048,
-            "top_p": 0.9
-        }
+    @staticmethod
+    def generate_blog_post(topic, max_retries=3, label=None):
+        """Generate a blog post using OpenRouter AI."""
+        template = get_template(label)
+        body = template.render(topic)
+        logger.info(f"Using prompt template: {template.name}")
 
         for attempt in range(max_retries):
             try:
                 response = requests.post(
                     ContentGenerator.OPENROUTER_API_URL,
-                    headers=headers,
-                    json=data
+                    headers=HEADERS,
+                    data=body
                 )
                 
                 logger.info(f"API Response Status: {response.status_code}")
@@ -64,6 +45,7 @@ class ContentGenerator:
                 
                 result = response.json()
                 content = result["choices"][0]["message"]["content"]
+                ContentGenerator.log_usage(result.get("usage"))
                 
                 logger.info(f"Successfully generated content of length: {len(content)}")
                 return content
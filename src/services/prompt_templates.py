@@ -0,0 +1,114 @@
+"""Precompiled prompt and request templates for content generation."""
+import json
+from ..utils.config import OPENROUTER_API_KEY, OPENROUTER_MODEL, PROMPT_TEMPLATE
+
+# Marker substituted into the serialized request body at compile time
+TOPIC_SLOT = "\x00TOPIC\x00"
+
+BASE_SYSTEM_MESSAGE = (
+    "You are a professional blog writer. Write engaging, well-researched, "
+    "and informative content. Use a conversational yet professional tone. "
+    "Format the content with proper HTML tags for better presentation."
+)
+
+BASE_REQUIREMENTS = (
+    "Requirements:\n"
+    "1. Around 500 words\n"
+    "2. Include a brief introduction that hooks the reader\n"
+    "3. Provide relevant details, examples, and analysis\n"
+    "4. End with a strong conclusion\n"
+    "5. Use proper HTML formatting (<h2> for headings, <p> for paragraphs)\n"
+    "6. Include SEO-friendly headings\n"
+    "7. Write in a clear, engaging style"
+)
+
+# Extra guidance appended to the static part of the prompt for each label
+LABEL_GUIDANCE = {
+    "Art": "Highlight the creative process, artists and cultural context.",
+    "Travel": "Include practical tips for visitors and a sense of place.",
+    "Life Style": "Keep the advice practical and relatable for everyday readers.",
+    "Photography": "Mention techniques, gear and composition where relevant.",
+    "Nature": "Emphasise the environment, wildlife and sustainability angles.",
+    "Food": "Describe flavours, ingredients and where to try the dishes.",
+    "Adventure": "Convey the thrill while covering safety and preparation."
+}
+
+HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/blog-bot",
+    "OR-ORGANIZATION": "github.com/blog-bot"
+}
+
+
+class PromptTemplate:
+    """A prompt whose request body is serialized once, leaving only the topic slot.
+
+    The system message and requirements come before the topic so the serialized
+    prefix is byte-identical across requests. Whether the provider actually caches
+    it depends on the model and its minimum prompt length; the cached token count
+    in the response usage shows whether it does.
+    """
+
+    def __init__(self, name, system_message, instructions, model=OPENROUTER_MODEL,
+                 temperature=0.7, max_tokens=2048, top_p=0.9):
+        self.name = name
+        self.system_message = system_message
+        self.instructions = instructions
+        self.model = model
+
+        data = {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": f"{instructions}\n\nTopic: {TOPIC_SLOT}"}
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "top_p": top_p,
+            "usage": {"include": True}
+        }
+        serialized = json.dumps(data, ensure_ascii=False)
+        placeholder = json.dumps(TOPIC_SLOT, ensure_ascii=False)[1:-1]
+        prefix, suffix = serialized.split(placeholder)
+        self._prefix = prefix.encode("utf-8")
+        self._suffix = suffix.encode("utf-8")
+
+    def render(self, topic):
+        """Return the serialized request body for the given topic."""
+        topic_json = json.dumps(str(topic), ensure_ascii=False)[1:-1]
+        return self._prefix + topic_json.encode("utf-8") + self._suffix
+
+
+def _build_instructions(guidance=None):
+    instructions = "Write an engaging and informative blog post about the topic below.\n\n"
+    instructions += BASE_REQUIREMENTS
+    if guidance:
+        instructions += f"\n8. {guidance}"
+    return instructions
+
+
+def _compile_registry():
+    registry = {
+        "default": PromptTemplate("default", BASE_SYSTEM_MESSAGE, _build_instructions())
+    }
+    for label, guidance in LABEL_GUIDANCE.items():
+        registry[label] = PromptTemplate(label, BASE_SYSTEM_MESSAGE, _build_instructions(guidance))
+    return registry
+
+
+# Compiled once at import time
+TEMPLATES = _compile_registry()
+
+if PROMPT_TEMPLATE and PROMPT_TEMPLATE not in TEMPLATES:
+    raise ValueError(
+        f"Unknown PROMPT_TEMPLATE '{PROMPT_TEMPLATE}'. "
+        f"Available templates: {', '.join(TEMPLATES)}"
+    )
+
+
+def get_template(label=None):
+    """Return the blog's configured template, else the label variant, else the default."""
+    if PROMPT_TEMPLATE:
+        return TEMPLATES[PROMPT_TEMPLATE]
+    return TEMPLATES.get(label, TEMPLATES["default"])
@@ -10,6 +10,12 @@ load_dotenv()
 OPENROUTER_API_KEY = os.getenv('OPENROUTER_API_KEY')
 BLOGGER_ID = os.getenv('BLOGGER_ID')
 
+# Model used for content generation
+OPENROUTER_MODEL = os.getenv('OPENROUTER_MODEL') or 'openai/gpt-3.5-turbo'
+
+# Optional prompt template for this blog; overrides the per-label variants
+PROMPT_TEMPLATE = os.getenv('PROMPT_TEMPLATE')
+
 def load_blogger_token(token_file='config/token.json'):
     """Load the Blogger OAuth token from the token file."""
     try: